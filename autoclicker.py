@@ -8,11 +8,23 @@ Modes:
 - Normal Mode: Click while holding M1 (left mouse button)
 """
 
+import queue
+import random
+import sys
 import threading
 import time
+
+# Optional: route Tk calls made from hotkey threads through the Tcl thread
+# (must be installed before tkinter is used)
+try:
+    import tkthread
+    tkthread.tkinstall()
+except ImportError:
+    pass
+
 import tkinter as tk
-from tkinter import messagebox, BOTH, X, LEFT, RIGHT, W
-from typing import Optional, Callable
+from tkinter import BOTH, X, LEFT, RIGHT, W
+from typing import Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -27,7 +39,7 @@ except ImportError:
 
 from pynput import mouse, keyboard
 from pynput.mouse import Button, Controller as MouseController
-from pynput.keyboard import Key, KeyCode, Controller as KeyboardController
+from pynput.keyboard import Key, Controller as KeyboardController
 
 
 def get_bootstyle_kwargs(style: str) -> dict:
@@ -37,6 +49,105 @@ def get_bootstyle_kwargs(style: str) -> dict:
     return {}
 
 
+# Deadline scheduler tuning (seconds): below SPIN_THRESHOLD the click loop
+# busy-waits instead of sleeping, and sleeps end SPIN_SLACK early.
+SPIN_THRESHOLD = 0.002
+SPIN_SLACK = 0.001
+# Longest single sleep on Windows, bounding how late a stop is noticed
+STOP_POLL_INTERVAL = 0.01
+
+# How often the GUI refreshes the click counter (milliseconds)
+COUNTER_POLL_MS = 100
+
+# dwExtraInfo value marking mouse events posted by the clicker on Windows
+SYNTHETIC_EVENT_TAG = 0x41434C4B  # "ACLK"
+
+
+def _load_native_mouse() -> Optional[Tuple[Callable, Callable, bool]]:
+    """Build (press, release, tagged) for posting left-button events directly
+    to the OS, or return None if the platform backend is unavailable.
+
+    press and release return True once the event has been posted. tagged is
+    True when posted events carry SYNTHETIC_EVENT_TAG.
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class MOUSEINPUT(ctypes.Structure):
+                _fields_ = [
+                    ("dx", wintypes.LONG),
+                    ("dy", wintypes.LONG),
+                    ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD),
+                    ("dwExtraInfo", ctypes.c_void_p),
+                ]
+
+            class INPUT(ctypes.Structure):
+                _fields_ = [("type", wintypes.DWORD), ("mi", MOUSEINPUT)]
+
+            INPUT_MOUSE = 0
+            MOUSEEVENTF_LEFTDOWN = 0x0002
+            MOUSEEVENTF_LEFTUP = 0x0004
+
+            send_input = ctypes.windll.user32.SendInput  # type: ignore
+            down = INPUT(INPUT_MOUSE, MOUSEINPUT(
+                dwFlags=MOUSEEVENTF_LEFTDOWN, dwExtraInfo=SYNTHETIC_EVENT_TAG))
+            up = INPUT(INPUT_MOUSE, MOUSEINPUT(
+                dwFlags=MOUSEEVENTF_LEFTUP, dwExtraInfo=SYNTHETIC_EVENT_TAG))
+            down_ref, up_ref = ctypes.byref(down), ctypes.byref(up)
+            size = ctypes.sizeof(INPUT)
+
+            # SendInput returns 0 when the event is blocked (e.g. by UIPI)
+            def press():
+                return send_input(1, down_ref, size) == 1
+
+            def release():
+                return send_input(1, up_ref, size) == 1
+
+            return press, release, True
+
+        elif sys.platform == "darwin":
+            import Quartz  # type: ignore
+
+            def _post(event_type):
+                pos = Quartz.CGEventGetLocation(Quartz.CGEventCreate(None))
+                event = Quartz.CGEventCreateMouseEvent(
+                    None, event_type, pos, Quartz.kCGMouseButtonLeft)
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+            def press():
+                _post(Quartz.kCGEventLeftMouseDown)
+                return True
+
+            def release():
+                _post(Quartz.kCGEventLeftMouseUp)
+                return True
+
+        else:
+            from Xlib import X  # type: ignore
+            from Xlib.display import Display  # type: ignore
+            from Xlib.ext import xtest  # type: ignore
+
+            display = Display()
+
+            def press():
+                xtest.fake_input(display, X.ButtonPress, 1)
+                display.flush()
+                return True
+
+            def release():
+                xtest.fake_input(display, X.ButtonRelease, 1)
+                display.flush()
+                return True
+
+        return press, release, False
+    except Exception:
+        return None
+
+
 class ClickMode(Enum):
     AUTOCLICK = "autoclick"
     KEYBIND = "keybind"
@@ -48,18 +159,24 @@ class AutoClickSettings:
     start_delay: float = 1.0
     clicks_per_sec: float = 10.0
     kill_hotkey: str = "F6"
+    down_time_ms: float = 20.0
+    jitter_sigma_ms: float = 0.0
 
 
 @dataclass
 class KeybindSettings:
     clicks_per_sec: float = 10.0
     autoclick_hotkey: str = "F7"
+    down_time_ms: float = 20.0
+    jitter_sigma_ms: float = 0.0
 
 
 @dataclass
 class NormalSettings:
     clicks_per_sec: float = 10.0
     start_delay: float = 0.5
+    down_time_ms: float = 20.0
+    jitter_sigma_ms: float = 0.0
 
 
 class ClickerEngine:
@@ -69,55 +186,181 @@ class ClickerEngine:
         self.mouse_controller = MouseController()
         self.keyboard_controller = KeyboardController()
         self.is_clicking = False
-        self.click_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self.click_count = 0
-        self.on_click_callback: Optional[Callable] = None
-
-    def set_click_callback(self, callback: Callable):
-        """Set callback function to be called on each click."""
-        self.on_click_callback = callback
-
-    def reset_click_count(self):
-        """Reset the click counter."""
-        self.click_count = 0
-        if self.on_click_callback:
-            self.on_click_callback(self.click_count)
-
-    def start_clicking(self, clicks_per_sec: float, delay: float = 0):
-        """Start the auto-clicking loop."""
-        if self.is_clicking:
-            return
+        self._session: tuple = ()
+        # Total clicks, written only by the click worker. Resets move
+        # _count_base instead so they can't race the worker's increment.
+        self._clicks_total = 0
+        self._count_base = 0
+        # Mouse events posted, written only by the click worker, which also
+        # moves _synthetic_base after each session so a count mismatch can't
+        # outlive it. Listeners use these to skip our own events
+        # when the backend can't tag them.
+        self.synthetic_events = 0
+        self._synthetic_base = 0
+
+        # Prefer posting clicks straight to the OS; fall back to pynput
+        native = _load_native_mouse()
+        if native:
+            self._press_fn, self._release_fn, self.tags_synthetic_events = \
+                native
+        else:
+            self._press_fn = self._pynput_press
+            self._release_fn = self._pynput_release
+            self.tags_synthetic_events = False
+
+        # One persistent worker runs every click session; start_clicking
+        # just hands it parameters instead of spawning a thread each time
+        self._go = threading.Event()
+        # Guards is_clicking, _stop_event and _session across threads
+        self._lock = threading.Lock()
+        self.click_thread = threading.Thread(target=self._run, daemon=True)
+        self.click_thread.start()
 
-        self.is_clicking = True
-        self._stop_event.clear()
+    def _precise_wait(self, deadline: float, stop: threading.Event):
+        """Wait until a perf_counter deadline or until stop is set."""
+        remaining = deadline - time.perf_counter()
+        if remaining > SPIN_THRESHOLD:
+            if sys.platform == "win32":
+                # Event.wait timeouts round up to the ~15.6 ms system tick
+                # on Windows; time.sleep is high resolution (natively on
+                # Python 3.11+, via timeBeginPeriod while clicking before)
+                end = deadline - SPIN_SLACK
+                while not stop.is_set():
+                    left = end - time.perf_counter()
+                    if left <= 0:
+                        break
+                    time.sleep(min(left, STOP_POLL_INTERVAL))
+            else:
+                stop.wait(remaining - SPIN_SLACK)
+        while time.perf_counter() < deadline and not stop.is_set():
+            # Yield the GIL so listener threads aren't starved while spinning
+            time.sleep(0)
+
+    def _pynput_press(self) -> bool:
+        """Press the left button through pynput."""
+        self.mouse_controller.press(Button.left)
+        return True
 
-        def click_loop():
-            if delay > 0:
-                # Wait for delay, checking for stop event periodically
-                elapsed = 0
-                while elapsed < delay and not self._stop_event.is_set():
-                    time.sleep(0.05)
-                    elapsed += 0.05
+    def _pynput_release(self) -> bool:
+        """Release the left button through pynput."""
+        self.mouse_controller.release(Button.left)
+        return True
 
-            interval = 1.0 / clicks_per_sec if clicks_per_sec > 0 else 0.1
+    def synthetic_events_posted(self) -> Tuple[int, int]:
+        """Return (marker, count) of events posted since clicking last
+        stopped; marker changes whenever the count is rebased."""
+        base = self._synthetic_base
+        return base, self.synthetic_events - base
 
-            while not self._stop_event.is_set():
-                self.mouse_controller.click(Button.left)
-                self.click_count += 1
-                if self.on_click_callback:
-                    self.on_click_callback(self.click_count)
-                time.sleep(interval)
+    @property
+    def click_count(self) -> int:
+        """Clicks since the last reset."""
+        return self._clicks_total - self._count_base
 
-            self.is_clicking = False
+    def reset_click_count(self):
+        """Reset the click counter."""
+        self._count_base = self._clicks_total
+
+    def start_clicking(self, clicks_per_sec: float, delay: float = 0,
+                       down_time: float = 0.02, jitter: float = 0.0):
+        """Start the auto-clicking loop.
+
+        down_time is how long (seconds) the button is held for each click,
+        capped at half the click interval. jitter is the standard deviation
+        (seconds) of Gaussian noise added to each interval.
+        """
+        with self._lock:
+            if self.is_clicking:
+                return
 
-        self.click_thread = threading.Thread(target=click_loop, daemon=True)
-        self.click_thread.start()
+            self.is_clicking = True
+            # Fresh stop event per session so a late-exiting previous
+            # session can't pick up this one's state
+            self._stop_event = threading.Event()
+            self._session = (self._stop_event, clicks_per_sec, delay,
+                             down_time, jitter)
+            self._go.set()
 
     def stop_clicking(self):
         """Stop the auto-clicking loop."""
-        self._stop_event.set()
-        self.is_clicking = False
+        with self._lock:
+            self._stop_event.set()
+            self.is_clicking = False
+
+    def _run(self):
+        """Worker thread body: run a click session each time one starts."""
+        while True:
+            self._go.wait()
+            with self._lock:
+                self._go.clear()
+                session = self._session
+            if sys.platform == "win32":
+                # Raise the system timer resolution for the session
+                import ctypes
+                winmm = ctypes.windll.winmm  # type: ignore
+                winmm.timeBeginPeriod(1)
+                try:
+                    self._click_session(*session)
+                finally:
+                    winmm.timeEndPeriod(1)
+            else:
+                self._click_session(*session)
+            # Rebase only once the session has posted its last event, so a
+            # count mismatch can't outlive it
+            self._synthetic_base = self.synthetic_events
+            with self._lock:
+                # Only clear the flag if no newer session has started
+                if session[0] is self._stop_event:
+                    self.is_clicking = False
+
+    def _click_session(self, stop: threading.Event, clicks_per_sec: float,
+                       delay: float, down_time: float, jitter: float):
+        """Click until stop is set."""
+        if delay > 0:
+            # Wait for delay, returning early if stopped
+            stop.wait(delay)
+
+        interval = 1.0 / clicks_per_sec if clicks_per_sec > 0 else 0.1
+        # Clicks released instantly are dropped by some apps, so hold
+        # the button briefly, but never for more than half the interval
+        dwell = min(max(down_time, 0.0), interval / 2)
+
+        # Bind hot-path lookups to locals once
+        press = self._press_fn
+        release = self._release_fn
+        wait_until = self._precise_wait
+        stop_is_set = stop.is_set
+        perf = time.perf_counter
+        gauss = random.gauss
+        min_interval, max_interval = interval * 0.5, interval * 1.5
+
+        # Pace clicks against absolute deadlines so sleep jitter doesn't
+        # accumulate; wait coarsely, then spin for the final stretch.
+        next_t = perf()
+        while not stop_is_set():
+            # Count each event before posting so the listener can never see
+            # it first; roll back if the post fails
+            self.synthetic_events += 1
+            if not press():
+                self.synthetic_events -= 1
+            if dwell:
+                wait_until(perf() + dwell, stop)
+            self.synthetic_events += 1
+            if not release():
+                self.synthetic_events -= 1
+            self._clicks_total += 1
+            if jitter:
+                next_t += min(max(interval + gauss(0, jitter),
+                                  min_interval), max_interval)
+            else:
+                next_t += interval
+            # After a stall (GC pause, slow post, suspended session) resume
+            # from now rather than firing the missed clicks in a burst
+            now = perf()
+            if next_t < now:
+                next_t = now
+            wait_until(next_t, stop)
 
 
 class HotkeyManager:
@@ -128,27 +371,81 @@ class HotkeyManager:
         self.mouse_listener: Optional[mouse.Listener] = None
         self.pressed_keys: set = set()
         self.callbacks: dict = {}
+        self._name_cache: dict = {}
         self.recording_callback: Optional[Callable] = None
         self.is_recording = False
 
+        # Untagged left-button events generated by the clicker itself are
+        # skipped by count; see ignore_synthetic_clicks
+        self._synthetic_source: Optional[Callable[[], Tuple[int, int]]] = None
+        self._synthetic_marker = 0
+        self._synthetic_seen = 0
+
+        # Hotkey callbacks run on a worker so listener callbacks return fast
+        self._event_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._event_thread = threading.Thread(
+            target=self._dispatch_events, daemon=True)
+        self._event_thread.start()
+
+    def _dispatch_events(self):
+        """Run queued hotkey and recording callbacks off the listener
+        thread."""
+        while True:
+            callback, arg = self._event_q.get()
+            try:
+                callback(arg)
+            except Exception as e:
+                print(f"Hotkey callback error: {e}")
+
     def start(self):
-        """Start keyboard and mouse listeners."""
+        """Start the keyboard listener.
+
+        The mouse listener is started separately via enable_mouse_listener
+        so system-wide clicks aren't hooked unless a mode needs them.
+        """
         self.keyboard_listener = keyboard.Listener(
             on_press=self._on_key_press,
             on_release=self._on_key_release
         )
-        self.mouse_listener = mouse.Listener(
-            on_click=self._on_mouse_click
-        )
         self.keyboard_listener.start()
-        self.mouse_listener.start()
 
     def stop(self):
         """Stop all listeners."""
         if self.keyboard_listener:
             self.keyboard_listener.stop()
-        if self.mouse_listener:
+        self.disable_mouse_listener()
+
+    def ignore_synthetic_clicks(self, source: Callable[[], Tuple[int, int]]):
+        """Skip left-button events produced by our own clicking, for click
+        backends that can't tag their events.
+
+        source returns (marker, count): count is the number of events posted
+        since marker last changed, which happens whenever clicking stops.
+        """
+        self._synthetic_source = source
+        self._synthetic_marker, self._synthetic_seen = source()
+
+    def enable_mouse_listener(self):
+        """Start the mouse listener if it isn't running."""
+        if self.mouse_listener is None:
+            # Resync so clicks posted while unhooked aren't expected
+            if self._synthetic_source is not None:
+                self._synthetic_marker, self._synthetic_seen = \
+                    self._synthetic_source()
+            kwargs = {}
+            if sys.platform == "win32":
+                kwargs["win32_event_filter"] = self._win32_event_filter
+            self.mouse_listener = mouse.Listener(
+                on_click=self._on_mouse_click,
+                **kwargs
+            )
+            self.mouse_listener.start()
+
+    def disable_mouse_listener(self):
+        """Stop the mouse listener if it is running."""
+        if self.mouse_listener is not None:
             self.mouse_listener.stop()
+            self.mouse_listener = None
 
     def register_hotkey(self, key_name: str, callback: Callable):
         """Register a callback for a specific hotkey."""
@@ -157,70 +454,112 @@ class HotkeyManager:
     def unregister_hotkey(self, key_name: str):
         """Unregister a hotkey callback."""
         key_lower = key_name.lower()
-        if key_lower in self.callbacks:
-            del self.callbacks[key_lower]
+        self.callbacks.pop(key_lower, None)
+        self.pressed_keys.discard(key_lower)
+
+    def clear_hotkeys(self):
+        """Unregister all hotkey callbacks."""
+        self.callbacks.clear()
+        self.pressed_keys.clear()
 
     def start_recording(self, callback: Callable):
         """Start recording the next keypress."""
         self.is_recording = True
         self.recording_callback = callback
 
-    def _key_to_name(self, key) -> str:
-        """Convert a pynput key to a readable name."""
+    def _key_to_name(self, key) -> Optional[str]:
+        """Convert a pynput key to a readable name.
+
+        Returns None for events that identify no key (no char and a zero
+        or missing virtual key code), which pynput emits on some platforms.
+        """
         if isinstance(key, Key):
             return key.name.upper()
-        elif isinstance(key, KeyCode):
-            if key.char:
-                return key.char.upper()
-            elif key.vk:
-                # Handle special keys by virtual key code
-                return f"VK_{key.vk}"
-        return str(key)
+        char = getattr(key, "char", None)
+        if char:
+            return char.upper()
+        vk = getattr(key, "vk", None)
+        if vk:
+            # Handle special keys by virtual key code
+            return f"VK_{vk}"
+        return None
+
+    def _name(self, key) -> str:
+        """Return the lower-cased hotkey name for key, cached per key.
+
+        Keys without a name map to "".
+        """
+        name = self._name_cache.get(key)
+        if name is None:
+            raw = self._key_to_name(key)
+            name = self._name_cache[key] = raw.lower() if raw else ""
+        return name
 
     def _on_key_press(self, key):
         """Handle key press events."""
-        key_name = self._key_to_name(key)
-
         if self.is_recording:
+            key_name = self._key_to_name(key)
+            if key_name is None:
+                return
             self.is_recording = False
             if self.recording_callback:
-                self.recording_callback(key_name)
+                self._event_q.put_nowait((self.recording_callback, key_name))
             return
 
-        self.pressed_keys.add(key_name.lower())
+        key_lower = self._name(key)
+        if not key_lower:
+            return
 
-        # Check for registered hotkeys
-        if key_name.lower() in self.callbacks:
-            self.callbacks[key_name.lower()]("press")
+        # Check for registered hotkeys; other keys are ignored entirely
+        callback = self.callbacks.get(key_lower)
+        if callback is not None:
+            self.pressed_keys.add(key_lower)
+            self._event_q.put_nowait((callback, "press"))
 
     def _on_key_release(self, key):
         """Handle key release events."""
-        key_name = self._key_to_name(key)
-        self.pressed_keys.discard(key_name.lower())
+        key_lower = self._name(key)
+        if not key_lower:
+            return
+
+        # Check for registered hotkeys; other keys are ignored entirely
+        callback = self.callbacks.get(key_lower)
+        if callback is not None:
+            self.pressed_keys.discard(key_lower)
+            self._event_q.put_nowait((callback, "release"))
 
-        # Check for registered hotkeys
-        if key_name.lower() in self.callbacks:
-            self.callbacks[key_name.lower()]("release")
+    def _win32_event_filter(self, msg, data):
+        """Keep events tagged by the clicker away from _on_mouse_click."""
+        return data.dwExtraInfo != SYNTHETIC_EVENT_TAG
 
     def _on_mouse_click(self, x, y, button, pressed):
         """Handle mouse click events."""
         if button == Button.left:
-            if pressed:
-                if "m1" in self.callbacks:
-                    self.callbacks["m1"]("press")
-            else:
-                if "m1" in self.callbacks:
-                    self.callbacks["m1"]("release")
+            source = self._synthetic_source
+            if source is not None:
+                marker, posted = source()
+                if marker != self._synthetic_marker:
+                    # Clicking stopped since the last event; start afresh
+                    self._synthetic_marker, self._synthetic_seen = marker, 0
+                if self._synthetic_seen < posted:
+                    self._synthetic_seen += 1
+                    return True
+            callback = self.callbacks.get("m1")
+            if callback is not None:
+                self._event_q.put_nowait(
+                    (callback, "press" if pressed else "release"))
         return True
 
     def is_key_pressed(self, key_name: str) -> bool:
-        """Check if a key is currently pressed."""
+        """Check if a registered hotkey is currently pressed."""
         return key_name.lower() in self.pressed_keys
 
 
 class AutoClickerGUI:
     """Main GUI application for the AutoClicker."""
 
+    _LABEL_FONT = ("Segoe UI", 11)
+
     def __init__(self):
         # Initialize settings
         self.autoclick_settings = AutoClickSettings()
@@ -230,6 +569,9 @@ class AutoClickerGUI:
         # Initialize engine and hotkey manager
         self.engine = ClickerEngine()
         self.hotkey_manager = HotkeyManager()
+        if not self.engine.tags_synthetic_events:
+            self.hotkey_manager.ignore_synthetic_clicks(
+                self.engine.synthetic_events_posted)
 
         # Current mode and state
         self.current_mode = ClickMode.AUTOCLICK
@@ -238,21 +580,36 @@ class AutoClickerGUI:
         # Build GUI
         self._build_gui()
 
+        # Parse hold-mode settings up front so hotkey handlers don't read
+        # Tk variables; their status updates go through root.after
+        self._cache_hold_settings()
+        for var in (self.keybind_cps_var, self.normal_cps_var,
+                    self.normal_delay_var):
+            var.trace_add("write", self._cache_hold_settings)
+
         # Start hotkey listener
         self.hotkey_manager.start()
         self._setup_hotkeys()
 
-        # Setup click counter callback
-        self.engine.set_click_callback(self._update_click_counter)
+        # Poll the click counter instead of queuing a Tk event per click
+        self._last_counter_shown = 0
+        self.root.after(COUNTER_POLL_MS, self._poll_click_counter)
 
-    def _update_click_counter(self, count: int):
-        """Update the click counter display (thread-safe)."""
-        self.root.after(
-            0, lambda: self.click_counter_var.set(f"Clicks: {count}"))
+    def _poll_click_counter(self):
+        """Refresh the click counter display from the engine periodically."""
+        self.root.after(COUNTER_POLL_MS, self._poll_click_counter)
+        count = self.engine.click_count
+        # Idle ticks skip the string formatting and the Tcl update
+        if count == self._last_counter_shown:
+            return
+        self._last_counter_shown = count
+        self.click_counter_var.set(f"Clicks: {count}")
 
     def _reset_click_counter(self):
         """Reset the click counter."""
         self.engine.reset_click_count()
+        self._last_counter_shown = 0
+        self.click_counter_var.set("Clicks: 0")
 
     def _build_gui(self):
         """Build the main GUI window."""
@@ -296,6 +653,16 @@ class AutoClickerGUI:
         self._create_keybind_tab()
         self._create_normal_tab()
 
+        # Mode, its start/enable button and idle label, in tab order
+        self._modes = [
+            (ClickMode.AUTOCLICK, self.autoclick_start_btn,
+             "▶ Start Autoclicking"),
+            (ClickMode.KEYBIND, self.keybind_enable_btn,
+             "🔓 Enable Keybind Mode"),
+            (ClickMode.NORMAL, self.normal_enable_btn,
+             "🔓 Enable Normal Mode"),
+        ]
+
         # Status section
         status_frame = ttk.Labelframe(
             main_frame, text="Status", padding=15, **get_bootstyle_kwargs("info"))
@@ -334,6 +701,56 @@ class AutoClickerGUI:
         # Bind tab change
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_change)
 
+    def _add_setting_row(self, parent, label_text: str) -> ttk.Frame:
+        """Add a labelled settings row and return its frame."""
+        row = ttk.Frame(parent)
+        row.pack(fill=X, pady=5)
+        ttk.Label(row, text=label_text, font=self._LABEL_FONT).pack(side=LEFT)
+        return row
+
+    def _add_entry_row(self, parent, label_text: str,
+                       var: tk.StringVar) -> ttk.Entry:
+        """Add a labelled settings row with an entry bound to var."""
+        row = self._add_setting_row(parent, label_text)
+        entry = ttk.Entry(row, textvariable=var, width=10,
+                          font=self._LABEL_FONT)
+        entry.pack(side=RIGHT)
+        return entry
+
+    def _add_click_timing_row(self, parent, settings) -> Tuple[
+            Tuple[tk.StringVar, ttk.Entry], Tuple[tk.StringVar, ttk.Entry]]:
+        """Add a hold time / jitter row that writes through to settings.
+
+        Returns (var, entry) pairs for hold time and jitter. Invalid input
+        is highlighted and leaves the setting at its last valid value.
+        """
+        row = self._add_setting_row(parent, "Hold Time / Jitter (ms):")
+        pairs = []
+        # Packed right to left, so jitter goes first
+        for field in ("jitter_sigma_ms", "down_time_ms"):
+            var = tk.StringVar(value=str(getattr(settings, field)))
+            entry = ttk.Entry(row, textvariable=var, width=4,
+                              font=self._LABEL_FONT)
+            entry.pack(side=RIGHT)
+            if field == "jitter_sigma_ms":
+                ttk.Label(row, text=" / ",
+                          font=self._LABEL_FONT).pack(side=RIGHT)
+
+            def write_setting(*_args, var=var, entry=entry, field=field):
+                value = self._parse_entry(var.get(), allow_zero=True)
+                self._mark_entry(entry, value is not None)
+                if value is not None:
+                    setattr(settings, field, value)
+
+            var.trace_add("write", write_setting)
+            pairs.append((var, entry))
+        return pairs[1], pairs[0]
+
+    def _mark_entry(self, entry: ttk.Entry, valid: bool):
+        """Style an entry as valid or invalid."""
+        entry.configure(
+            **get_bootstyle_kwargs("default" if valid else "danger"))
+
     def _create_autoclick_tab(self):
         """Create the Autoclick Mode tab."""
         frame = ttk.Frame(self.notebook, padding=20)
@@ -353,32 +770,32 @@ class AutoClickerGUI:
         settings_frame.pack(fill=X)
 
         # Start Delay
-        row1 = ttk.Frame(settings_frame)
-        row1.pack(fill=X, pady=8)
-        ttk.Label(row1, text="Start Delay (sec):",
-                  font=("Segoe UI", 11)).pack(side=LEFT)
         self.autoclick_delay_var = tk.StringVar(
             value=str(self.autoclick_settings.start_delay))
-        delay_entry = ttk.Entry(
-            row1, textvariable=self.autoclick_delay_var, width=10, font=("Segoe UI", 11))
-        delay_entry.pack(side=RIGHT)
+        self.autoclick_delay_entry = self._add_entry_row(
+            settings_frame, "Start Delay (sec):", self.autoclick_delay_var)
 
         # Clicks per second
-        row2 = ttk.Frame(settings_frame)
-        row2.pack(fill=X, pady=8)
-        ttk.Label(row2, text="Clicks per Second:",
-                  font=("Segoe UI", 11)).pack(side=LEFT)
         self.autoclick_cps_var = tk.StringVar(
             value=str(self.autoclick_settings.clicks_per_sec))
-        cps_entry = ttk.Entry(
-            row2, textvariable=self.autoclick_cps_var, width=10, font=("Segoe UI", 11))
-        cps_entry.pack(side=RIGHT)
+        self.autoclick_cps_entry = self._add_entry_row(
+            settings_frame, "Clicks per Second:", self.autoclick_cps_var)
+
+        # Hold time and jitter
+        ((self.autoclick_down_time_var, self.autoclick_down_time_entry),
+         (self.autoclick_jitter_var, self.autoclick_jitter_entry)) = \
+            self._add_click_timing_row(settings_frame,
+                                       self.autoclick_settings)
+
+        # Validate inline rather than with a modal dialog
+        for entry in (self.autoclick_delay_entry, self.autoclick_cps_entry,
+                      self.autoclick_down_time_entry,
+                      self.autoclick_jitter_entry):
+            entry.bind("<FocusOut>",
+                       lambda _e: self._validate_autoclick_entries())
 
         # Kill hotkey
-        row3 = ttk.Frame(settings_frame)
-        row3.pack(fill=X, pady=8)
-        ttk.Label(row3, text="Start/Stop Hotkey:",
-                  font=("Segoe UI", 11)).pack(side=LEFT)
+        row3 = self._add_setting_row(settings_frame, "Start/Stop Hotkey:")
         hotkey_frame = ttk.Frame(row3)
         hotkey_frame.pack(side=RIGHT)
         self.autoclick_hotkey_var = tk.StringVar(
@@ -392,6 +809,15 @@ class AutoClickerGUI:
         )
         self.autoclick_hotkey_btn.pack()
 
+        # Inline validation error, only packed while there is one
+        self._error_var = tk.StringVar(value="")
+        self._error_label = ttk.Label(
+            frame,
+            textvariable=self._error_var,
+            font=("Segoe UI", 9),
+            foreground="red"
+        )
+
         # Start button
         self.autoclick_start_btn = ttk.Button(
             frame,
@@ -400,7 +826,7 @@ class AutoClickerGUI:
             **get_bootstyle_kwargs("success"),
             width=25
         )
-        self.autoclick_start_btn.pack(pady=(30, 0))
+        self.autoclick_start_btn.pack(pady=(20, 0))
 
     def _create_keybind_tab(self):
         """Create the Keybind Mode tab."""
@@ -421,21 +847,18 @@ class AutoClickerGUI:
         settings_frame.pack(fill=X)
 
         # Clicks per second
-        row1 = ttk.Frame(settings_frame)
-        row1.pack(fill=X, pady=8)
-        ttk.Label(row1, text="Clicks per Second:",
-                  font=("Segoe UI", 11)).pack(side=LEFT)
         self.keybind_cps_var = tk.StringVar(
             value=str(self.keybind_settings.clicks_per_sec))
-        cps_entry = ttk.Entry(
-            row1, textvariable=self.keybind_cps_var, width=10, font=("Segoe UI", 11))
-        cps_entry.pack(side=RIGHT)
+        self._add_entry_row(settings_frame, "Clicks per Second:",
+                            self.keybind_cps_var)
+
+        # Hold time and jitter
+        ((self.keybind_down_time_var, _),
+         (self.keybind_jitter_var, _)) = \
+            self._add_click_timing_row(settings_frame, self.keybind_settings)
 
         # Autoclick hotkey
-        row2 = ttk.Frame(settings_frame)
-        row2.pack(fill=X, pady=8)
-        ttk.Label(row2, text="Hold to Click Key:",
-                  font=("Segoe UI", 11)).pack(side=LEFT)
+        row2 = self._add_setting_row(settings_frame, "Hold to Click Key:")
         hotkey_frame = ttk.Frame(row2)
         hotkey_frame.pack(side=RIGHT)
         self.keybind_hotkey_var = tk.StringVar(
@@ -457,7 +880,7 @@ class AutoClickerGUI:
             **get_bootstyle_kwargs("success"),
             width=25
         )
-        self.keybind_enable_btn.pack(pady=(30, 0))
+        self.keybind_enable_btn.pack(pady=(20, 0))
 
         # Info label
         info_label = ttk.Label(
@@ -487,26 +910,21 @@ class AutoClickerGUI:
         settings_frame.pack(fill=X)
 
         # Clicks per second
-        row1 = ttk.Frame(settings_frame)
-        row1.pack(fill=X, pady=8)
-        ttk.Label(row1, text="Clicks per Second:",
-                  font=("Segoe UI", 11)).pack(side=LEFT)
         self.normal_cps_var = tk.StringVar(
             value=str(self.normal_settings.clicks_per_sec))
-        cps_entry = ttk.Entry(
-            row1, textvariable=self.normal_cps_var, width=10, font=("Segoe UI", 11))
-        cps_entry.pack(side=RIGHT)
+        self._add_entry_row(settings_frame, "Clicks per Second:",
+                            self.normal_cps_var)
 
         # Start Delay
-        row2 = ttk.Frame(settings_frame)
-        row2.pack(fill=X, pady=8)
-        ttk.Label(row2, text="Start Delay (sec):",
-                  font=("Segoe UI", 11)).pack(side=LEFT)
         self.normal_delay_var = tk.StringVar(
             value=str(self.normal_settings.start_delay))
-        delay_entry = ttk.Entry(
-            row2, textvariable=self.normal_delay_var, width=10, font=("Segoe UI", 11))
-        delay_entry.pack(side=RIGHT)
+        self._add_entry_row(settings_frame, "Start Delay (sec):",
+                            self.normal_delay_var)
+
+        # Hold time and jitter
+        ((self.normal_down_time_var, _),
+         (self.normal_jitter_var, _)) = \
+            self._add_click_timing_row(settings_frame, self.normal_settings)
 
         # Enable button
         self.normal_enable_btn = ttk.Button(
@@ -516,7 +934,7 @@ class AutoClickerGUI:
             **get_bootstyle_kwargs("success"),
             width=25
         )
-        self.normal_enable_btn.pack(pady=(30, 0))
+        self.normal_enable_btn.pack(pady=(20, 0))
 
         # Info label
         info_label = ttk.Label(
@@ -532,12 +950,12 @@ class AutoClickerGUI:
         if mode == "autoclick":
             self.autoclick_hotkey_var.set("Press key...")
             self.hotkey_manager.start_recording(
-                lambda key: self._set_hotkey(mode, key)
+                lambda key: self.root.after(0, self._set_hotkey, mode, key)
             )
         elif mode == "keybind":
             self.keybind_hotkey_var.set("Press key...")
             self.hotkey_manager.start_recording(
-                lambda key: self._set_hotkey(mode, key)
+                lambda key: self.root.after(0, self._set_hotkey, mode, key)
             )
 
     def _set_hotkey(self, mode: str, key: str):
@@ -555,7 +973,7 @@ class AutoClickerGUI:
     def _setup_hotkeys(self):
         """Setup all hotkey callbacks."""
         # Clear existing
-        self.hotkey_manager.callbacks.clear()
+        self.hotkey_manager.clear_hotkeys()
 
         # Autoclick mode hotkey
         def autoclick_hotkey_handler(event_type):
@@ -573,13 +991,14 @@ class AutoClickerGUI:
                 return
             if event_type == "press":
                 if not self.engine.is_clicking:
-                    cps = self._get_float_value(
-                        self.keybind_cps_var.get(), 10.0)
-                    self.engine.start_clicking(cps, delay=0)
-                    self._update_status(True)
+                    self.engine.start_clicking(
+                        self._cached_keybind_cps, delay=0,
+                        down_time=self.keybind_settings.down_time_ms / 1000,
+                        jitter=self.keybind_settings.jitter_sigma_ms / 1000)
+                    self.root.after(0, self._update_status, True)
             elif event_type == "release":
                 self.engine.stop_clicking()
-                self._update_status(False)
+                self.root.after(0, self._update_status, False)
 
         self.hotkey_manager.register_hotkey(
             self.keybind_settings.autoclick_hotkey,
@@ -592,15 +1011,15 @@ class AutoClickerGUI:
                 return
             if event_type == "press":
                 if not self.engine.is_clicking:
-                    cps = self._get_float_value(
-                        self.normal_cps_var.get(), 10.0)
-                    delay = self._get_float_value(
-                        self.normal_delay_var.get(), 0.5)
-                    self.engine.start_clicking(cps, delay=delay)
-                    self._update_status(True)
+                    self.engine.start_clicking(
+                        self._cached_normal_cps,
+                        delay=self._cached_normal_delay,
+                        down_time=self.normal_settings.down_time_ms / 1000,
+                        jitter=self.normal_settings.jitter_sigma_ms / 1000)
+                    self.root.after(0, self._update_status, True)
             elif event_type == "release":
                 self.engine.stop_clicking()
-                self._update_status(False)
+                self.root.after(0, self._update_status, False)
 
         self.hotkey_manager.register_hotkey("m1", normal_mode_handler)
 
@@ -608,30 +1027,56 @@ class AutoClickerGUI:
         """Toggle autoclick mode on/off."""
         if self.engine.is_clicking:
             self.engine.stop_clicking()
+            self._reset_mode_button(ClickMode.AUTOCLICK)
+            self._update_status(False)
+        else:
+            if not self._validate_autoclick_entries():
+                return
+
+            cps = self._get_float_value(self.autoclick_cps_var.get(), 10.0)
+            delay = self._get_float_value(self.autoclick_delay_var.get(), 1.0)
+
+            self.engine.start_clicking(
+                cps, delay=delay,
+                down_time=self.autoclick_settings.down_time_ms / 1000,
+                jitter=self.autoclick_settings.jitter_sigma_ms / 1000)
             self.autoclick_start_btn.configure(
-                text="▶ Start Autoclicking",
-                **get_bootstyle_kwargs("success")
+                text="⏹ Stop Autoclicking",
+                **get_bootstyle_kwargs("danger")
             )
-            self._update_status(False)
+            self._update_status(True)
+
+    def _validate_autoclick_entries(self) -> bool:
+        """Highlight invalid autoclick entries and show an inline error."""
+        error = ""
+        for label, entry, var, allow_zero in (
+            ("Start delay", self.autoclick_delay_entry,
+             self.autoclick_delay_var, False),
+            ("Clicks per second", self.autoclick_cps_entry,
+             self.autoclick_cps_var, False),
+            ("Hold time", self.autoclick_down_time_entry,
+             self.autoclick_down_time_var, True),
+            ("Jitter", self.autoclick_jitter_entry,
+             self.autoclick_jitter_var, True),
+        ):
+            valid = self._parse_entry(var.get(), allow_zero) is not None
+            self._mark_entry(entry, valid)
+            if not valid and not error:
+                kind = "non-negative" if allow_zero else "positive"
+                error = f"{label} must be a {kind} number."
+        self._error_var.set(error)
+        if error:
+            self._error_label.pack(anchor=W, pady=(5, 0),
+                                   before=self.autoclick_start_btn)
         else:
-            try:
-                cps = self._get_float_value(self.autoclick_cps_var.get(), 10.0)
-                delay = self._get_float_value(
-                    self.autoclick_delay_var.get(), 1.0)
-
-                self.engine.start_clicking(cps, delay=delay)
-                self.autoclick_start_btn.configure(
-                    text="⏹ Stop Autoclicking",
-                    **get_bootstyle_kwargs("danger")
-                )
-                self._update_status(True)
-            except ValueError as e:
-                messagebox.showerror("Invalid Input", str(e))
+            self._error_label.pack_forget()
+        return not error
 
     def _toggle_keybind(self):
         """Toggle keybind mode enabled/disabled."""
         self.is_active = not self.is_active
         self.current_mode = ClickMode.KEYBIND
+        self._cache_hold_settings()
 
         if self.is_active:
             self.keybind_enable_btn.configure(
@@ -642,18 +1087,17 @@ class AutoClickerGUI:
                 False, mode_text=f"Keybind Mode Active - Hold {self.keybind_settings.autoclick_hotkey}")
         else:
             self.engine.stop_clicking()
-            self.keybind_enable_btn.configure(
-                text="🔓 Enable Keybind Mode",
-                **get_bootstyle_kwargs("success")
-            )
+            self._reset_mode_button(ClickMode.KEYBIND)
             self._update_status(False)
 
     def _toggle_normal(self):
         """Toggle normal mode enabled/disabled."""
         self.is_active = not self.is_active
         self.current_mode = ClickMode.NORMAL
+        self._cache_hold_settings()
 
         if self.is_active:
+            self.hotkey_manager.enable_mouse_listener()
             self.normal_enable_btn.configure(
                 text="🔒 Disable Normal Mode",
                 **get_bootstyle_kwargs("danger")
@@ -661,11 +1105,9 @@ class AutoClickerGUI:
             self._update_status(
                 False, mode_text="Normal Mode Active - Hold M1 to Click")
         else:
+            self.hotkey_manager.disable_mouse_listener()
             self.engine.stop_clicking()
-            self.normal_enable_btn.configure(
-                text="🔓 Enable Normal Mode",
-                **get_bootstyle_kwargs("success")
-            )
+            self._reset_mode_button(ClickMode.NORMAL)
             self._update_status(False)
 
     def _update_status(self, is_clicking: bool, mode_text: Optional[str] = None):
@@ -686,15 +1128,40 @@ class AutoClickerGUI:
                 **get_bootstyle_kwargs("danger")
             )
 
-    def _get_float_value(self, value: str, default: float) -> float:
-        """Parse a float value from string with validation."""
+    def _cache_hold_settings(self, *_args):
+        """Parse keybind/normal mode entries into floats for the handlers."""
+        self._cached_keybind_cps = self._get_float_value(
+            self.keybind_cps_var.get(), 10.0)
+        self._cached_normal_cps = self._get_float_value(
+            self.normal_cps_var.get(), 10.0)
+        self._cached_normal_delay = self._get_float_value(
+            self.normal_delay_var.get(), 0.5)
+
+    def _parse_entry(self, value: str,
+                     allow_zero: bool = False) -> Optional[float]:
+        """Parse an entry's text, returning None if it isn't valid."""
         try:
             result = float(value)
-            if result <= 0:
-                raise ValueError(f"Value must be positive, got {result}")
-            return result
         except ValueError:
-            return default
+            return None
+        if result > 0 or (allow_zero and result == 0):
+            return result
+        return None
+
+    def _get_float_value(self, value: str, default: float) -> float:
+        """Parse a positive float from string, falling back to default."""
+        result = self._parse_entry(value)
+        return default if result is None else result
+
+    def _reset_mode_button(self, mode: ClickMode):
+        """Return a mode's start/enable button to its idle state."""
+        for button_mode, button, idle_text in self._modes:
+            if button_mode is mode:
+                button.configure(
+                    text=idle_text,
+                    **get_bootstyle_kwargs("success")
+                )
+                return
 
     def _on_tab_change(self, event):
         """Handle tab change events."""
@@ -703,29 +1170,14 @@ class AutoClickerGUI:
 
         # Disable modes when switching
         self.is_active = False
+        self.hotkey_manager.disable_mouse_listener()
 
-        # Reset all buttons
-        self.autoclick_start_btn.configure(
-            text="▶ Start Autoclicking",
-            **get_bootstyle_kwargs("success")
-        )
-        self.keybind_enable_btn.configure(
-            text="🔓 Enable Keybind Mode",
-            **get_bootstyle_kwargs("success")
-        )
-        self.normal_enable_btn.configure(
-            text="🔓 Enable Normal Mode",
-            **get_bootstyle_kwargs("success")
-        )
+        # Only the current mode's button can be out of its idle state
+        self._reset_mode_button(self.current_mode)
 
         # Update current mode
         tab_index = self.notebook.index(self.notebook.select())
-        if tab_index == 0:
-            self.current_mode = ClickMode.AUTOCLICK
-        elif tab_index == 1:
-            self.current_mode = ClickMode.KEYBIND
-        else:
-            self.current_mode = ClickMode.NORMAL
+        self.current_mode = self._modes[tab_index][0]
 
         self._update_status(False)
 